@@ -57,7 +57,12 @@ RIMWORLD_DLC_METADATA = {
         "description": "DLC #4",
     },
 }
-RIMWORLD_PACKAGE_IDS = [v["packageid"] for v in RIMWORLD_DLC_METADATA.values()]
+RIMWORLD_PACKAGE_IDS = frozenset(v["packageid"] for v in RIMWORLD_DLC_METADATA.values())
+# Flattened RIMWORLD_DLC_METADATA lookup: packageid -> (appid, name, steam_url, description)
+RIMWORLD_DLC_BY_PACKAGEID: dict[str, tuple[str, str, str, str]] = {
+    v["packageid"]: (appid, v["name"], v["steam_url"], v["description"])
+    for appid, v in RIMWORLD_DLC_METADATA.items()
+}
 SEARCH_DATA_SOURCE_FILTER_INDEXES = [
     "all",
     "expansion",
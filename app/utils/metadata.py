@@ -1,12 +1,13 @@
 import json
 import os
-import traceback
+import re
+from functools import lru_cache
 from pathlib import Path
-from re import match
 from time import localtime, strftime, time
-from typing import Any, Iterable, Optional, Union
+from typing import Any, Collection, Iterable, Optional, Union
 from uuid import uuid4
 
+import msgspec
 from loguru import logger
 from natsort import natsorted
 from PySide6.QtCore import (
@@ -23,6 +24,7 @@ from app.utils.constants import (
     DB_BUILDER_PRUNE_EXCEPTIONS,
     DB_BUILDER_RECURSE_EXCEPTIONS,
     DEFAULT_USER_RULES,
+    RIMWORLD_DLC_BY_PACKAGEID,
     RIMWORLD_DLC_METADATA,
 )
 from app.utils.generic import directories
@@ -33,7 +35,11 @@ from app.utils.steam.webapi.wrapper import (
     DynamicQuery,
     ISteamRemoteStorage_GetPublishedFileDetails,
 )
-from app.utils.xml import json_to_xml_write, xml_path_to_json
+from app.utils.xml import (
+    json_to_xml_write,
+    mod_metadata_xml_path_to_json,
+    xml_path_to_json,
+)
 from app.views.dialogue import (
     show_dialogue_conditional,
     show_dialogue_file,
@@ -143,56 +149,52 @@ class MetadataManager(QObject):
             life: int, path: str
         ) -> tuple[Optional[dict[str, Any]], Optional[str]]:
             logger.info(f"Checking for Steam DB at: {path}")
-            if os.path.exists(
-                path
-            ):  # Look for cached data & load it if available & not expired
+            db_data = read_json_db(path)
+            if db_data is not None:  # Load cached data if available & not expired
                 logger.info(
                     "Steam DB exists!",
                 )
-                with open(path, encoding="utf-8") as f:
-                    json_string = f.read()
-                    logger.info("Checking metadata expiry against database...")
-                    db_data = json.loads(json_string)
-                    current_time = int(time())
-                    db_time = int(db_data["version"])
-                    elapsed = current_time - db_time
-                    if (
-                        elapsed <= life
-                    ):  # If the duration elapsed since db creation is less than expiry than expiry
-                        # The data is valid
-                        db_json_data = db_data[
-                            "database"
-                        ]  # TODO: additional check to verify integrity of this data's schema
-                        logger.info(
-                            "Cached Steam DB is valid! Returning data to RimSort..."
-                        )
-                        total_entries = len(db_json_data)
-                        logger.info(
-                            f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
-                        )
-                    else:  # If the cached db data is expired but NOT missing
-                        # Fallback to the expired metadata
-                        if life != 0:  # Disable Notification if value is 0
-                            self.show_warning_signal.emit(
-                                "Steam DB metadata expired",
-                                "Steam DB is expired! Consider updating!\n",
-                                f'Steam DB last updated: {strftime("%Y-%m-%d %H:%M:%S", localtime(db_data["version"] - life))}\n\n'
-                                + "Falling back to cached, but EXPIRED Steam Database...",
-                                "",
-                            )
-                        db_json_data = db_data[
-                            "database"
-                        ]  # TODO: additional check to verify integrity of this data's schema
-                        total_entries = len(db_json_data)
-                        logger.info(
-                            f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                logger.info("Checking metadata expiry against database...")
+                current_time = int(time())
+                db_time = int(db_data["version"])
+                elapsed = current_time - db_time
+                if (
+                    elapsed <= life
+                ):  # If the duration elapsed since db creation is less than expiry than expiry
+                    # The data is valid
+                    db_json_data = db_data[
+                        "database"
+                    ]  # TODO: additional check to verify integrity of this data's schema
+                    logger.info(
+                        "Cached Steam DB is valid! Returning data to RimSort..."
+                    )
+                    total_entries = len(db_json_data)
+                    logger.info(
+                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                    )
+                else:  # If the cached db data is expired but NOT missing
+                    # Fallback to the expired metadata
+                    if life != 0:  # Disable Notification if value is 0
+                        self.show_warning_signal.emit(
+                            "Steam DB metadata expired",
+                            "Steam DB is expired! Consider updating!\n",
+                            f'Steam DB last updated: {strftime("%Y-%m-%d %H:%M:%S", localtime(db_data["version"] - life))}\n\n'
+                            + "Falling back to cached, but EXPIRED Steam Database...",
+                            "",
                         )
-                    self.steamdb_packageid_to_name = {
-                        metadata["packageid"]: metadata["name"]
-                        for metadata in db_data.get("database", {}).values()
-                        if metadata.get("packageid") and metadata.get("name")
-                    }
-                    return db_json_data, path
+                    db_json_data = db_data[
+                        "database"
+                    ]  # TODO: additional check to verify integrity of this data's schema
+                    total_entries = len(db_json_data)
+                    logger.info(
+                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                    )
+                self.steamdb_packageid_to_name = {
+                    metadata["packageid"]: metadata["name"]
+                    for metadata in db_data.get("database", {}).values()
+                    if metadata.get("packageid") and metadata.get("name")
+                }
+                return db_json_data, path
 
             else:  # Assume db_data_missing
                 self.show_warning_signal.emit(
@@ -208,22 +210,18 @@ class MetadataManager(QObject):
             path: str,
         ) -> tuple[Optional[dict[str, Any]], Optional[str]]:
             logger.info(f"Checking for Community Rules DB at: {path}")
-            if os.path.exists(
-                path
-            ):  # Look for cached data & load it if available & not expired
+            rule_data = read_json_db(path)
+            if rule_data is not None:  # Load cached data if available & not expired
                 logger.info(
                     "Community Rules DB exists!",
                 )
-                with open(path, encoding="utf-8") as f:
-                    json_string = f.read()
-                    logger.info("Reading info from communityRules.json")
-                    rule_data = json.loads(json_string)
-                    community_rules_json_data = rule_data["rules"]
-                    total_entries = len(community_rules_json_data)
-                    logger.info(
-                        f"Loaded {total_entries} additional sorting rules from Community Rules"
-                    )
-                    return community_rules_json_data, path
+                logger.info("Reading info from communityRules.json")
+                community_rules_json_data = rule_data["rules"]
+                total_entries = len(community_rules_json_data)
+                logger.info(
+                    f"Loaded {total_entries} additional sorting rules from Community Rules"
+                )
+                return community_rules_json_data, path
 
             else:  # Assume db_data_missing
                 self.show_warning_signal.emit(
@@ -448,33 +446,22 @@ class MetadataManager(QObject):
             logger.info(
                 "Finished querying Official expansions. Supplementing metadata..."
             )
-            # Create a packageid to appid mapping for quicker lookup
-            package_to_app = {
-                dlc["packageid"]: appid for appid, dlc in RIMWORLD_DLC_METADATA.items()
-            }
             # Base game and expansion About.xml do not contain name, so these
             # must be manually added
             for metadata in self.internal_local_metadata.values():
-                package_id = metadata["packageid"]
-                appid = package_to_app.get(package_id)
-                if appid:
-                    dlc_metadata = RIMWORLD_DLC_METADATA[appid]
+                dlc_metadata = RIMWORLD_DLC_BY_PACKAGEID.get(metadata["packageid"])
+                if dlc_metadata:
+                    appid, name, steam_url, description = dlc_metadata
+                    # Update metadata in place, without building a temporary dict
+                    metadata["appid"] = appid
+                    metadata["name"] = name
+                    metadata["steam_url"] = steam_url
+                    metadata["description"] = description
                     # Default for supported versions if not already present
-                    default_versions = {
-                        "li": ".".join(self.game_version.split(".")[:2])
-                    }
-                    # Update metadata efficiently
-                    metadata.update(
-                        {
-                            "appid": appid,
-                            "name": dlc_metadata["name"],
-                            "steam_url": dlc_metadata["steam_url"],
-                            "description": dlc_metadata["description"],
-                            "supportedversions": metadata.get(
-                                "supportedversions", default_versions
-                            ),
+                    if "supportedversions" not in metadata:
+                        metadata["supportedversions"] = {
+                            "li": ".".join(self.game_version.split(".")[:2])
                         }
-                    )
         else:
             logger.error(
                 "Skipping parsing data from empty game data path. Is the game path configured?"
@@ -571,40 +558,44 @@ class MetadataManager(QObject):
         self.steamcmd_acf_path = self.steamcmd_wrapper.steamcmd_appworkshop_acf_path
         self.user_rules_file_path = str(AppInfo().databases_folder / "userRules.json")
 
-    def compile_metadata(self, uuids: list[str] = []) -> None:
+    def compile_metadata(self, uuids: Collection[str] = ()) -> None:
         """
         Iterate through each expansion or mod and add new key-values describing the
         dependencies, incompatibilities, and load order rules compiled from metadata.
         """
-        # Compile metadata for all mods if uuids is None
-        uuids = uuids or list(self.internal_local_metadata.keys())
+        # Compile metadata for all mods if no uuids are given. Take a snapshot, as
+        # watchdog events can add or remove mods while a refresh is running
+        uuids = uuids or list(self.internal_local_metadata)
         logger.info(f"Started compiling metadata for {len(uuids)} mods")
 
         # Add dependencies to installed mods based on dependencies listed in About.xml TODO manifest.xml
         logger.info("Started compiling metadata from About.xml")
+        # Package ids of the installed mods, built once for every incompatibility check
+        installed_packageids = {
+            mod_data["packageid"]
+            for mod_data in list(self.internal_local_metadata.values())
+        }
+        # Compiled on the first mod declaring <...ByVersion> blocks, so an unreadable
+        # game version only affects mods that actually declare them
+        version_pattern: Optional[re.Pattern[str]] = None
         for uuid in uuids:
-            logger.debug(
-                f"UUID: {uuid} packageid: "
-                + self.internal_local_metadata[uuid].get("packageid")
-            )
+            # Look up each mod and each optional tag once; most tags are absent
+            mod_data = self.internal_local_metadata[uuid]
+            logger.debug(f"UUID: {uuid} packageid: " + mod_data.get("packageid"))
             # moddependencies are not equal to mod load order rules
-            if self.internal_local_metadata[uuid].get("moddependencies"):
-                if isinstance(
-                    self.internal_local_metadata[uuid]["moddependencies"], dict
-                ):
-                    dependencies = self.internal_local_metadata[uuid][
-                        "moddependencies"
-                    ].get("li")
-                elif isinstance(
-                    self.internal_local_metadata[uuid]["moddependencies"], list
-                ):
+            moddependencies = mod_data.get("moddependencies")
+            if moddependencies:
+                dependencies = None
+                # Parsed XML only contains exact dict/list/str types
+                moddependencies_type = type(moddependencies)
+                if moddependencies_type is dict:
+                    dependencies = moddependencies.get("li")
+                elif moddependencies_type is list:
                     # Loop through the list and try to find dictionary. If we find one, use it.
-                    for potential_dependencies in self.internal_local_metadata[uuid][
-                        "moddependencies"
-                    ]:
+                    for potential_dependencies in moddependencies:
                         if (
                             potential_dependencies
-                            and isinstance(potential_dependencies, dict)
+                            and type(potential_dependencies) is dict
                             and potential_dependencies.get("li")
                         ):
                             dependencies = potential_dependencies["li"]
@@ -613,264 +604,59 @@ class MetadataManager(QObject):
                         f"Current mod requires these mods to work: {dependencies}"
                     )
                     add_dependency_to_mod(
-                        self.internal_local_metadata[uuid],
+                        mod_data,
                         dependencies,
                         self.internal_local_metadata,
                     )
 
-            if self.internal_local_metadata[uuid].get("moddependenciesbyversion"):
-                major, minor = self.game_version.split(".")[
-                    :2
-                ]  # Split the version and take the first two parts
-                version_regex = rf"v{major}\.{minor}"  # Construct the regex to match both major and minor versions
-                for version, dependencies_by_ver in self.internal_local_metadata[uuid][
-                    "moddependenciesbyversion"
-                ].items():
-                    if match(version_regex, version):
-                        if (
-                            dependencies_by_ver
-                            and isinstance(dependencies_by_ver, dict)
-                            and dependencies_by_ver.get("li")
-                        ):
-                            logger.debug(
-                                f"Current mod requires these mods by version to work: {dependencies_by_ver['li']}"
-                            )
-                            add_dependency_to_mod(
-                                self.internal_local_metadata[uuid],
-                                dependencies_by_ver["li"],
-                                self.internal_local_metadata,
-                            )
-                        else:
-                            logger.warning(
-                                f"About.xml syntax error. Unable to read <moddependenciesbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                            )
-                            logger.debug(dependencies_by_ver)
-            if self.internal_local_metadata[uuid].get("incompatiblewith"):
-                incompatibilities = self.internal_local_metadata[uuid][
-                    "incompatiblewith"
-                ].get("li")
-                if incompatibilities:
+            # Match every <...ByVersion> block against the game version in one sweep
+            if version_pattern is None and any(
+                mod_data.get(by_version_key) for by_version_key in _BY_VERSION_KEYS
+            ):
+                version_pattern = get_version_pattern(self.game_version)
+            rules_by_version = (
+                get_rules_by_version(mod_data, version_pattern)
+                if version_pattern is not None
+                else {}
+            )
+            for version, dependencies_by_ver in rules_by_version.get(
+                "moddependenciesbyversion", ()
+            ):
+                if (
+                    dependencies_by_ver
+                    and type(dependencies_by_ver) is dict
+                    and dependencies_by_ver.get("li")
+                ):
                     logger.debug(
-                        f"Current mod is incompatible with these mods: {incompatibilities}"
+                        f"Current mod requires these mods by version to work: {dependencies_by_ver['li']}"
                     )
-                    add_incompatibility_to_mod(
-                        self.internal_local_metadata[uuid],
-                        incompatibilities,
+                    add_dependency_to_mod(
+                        mod_data,
+                        dependencies_by_ver["li"],
                         self.internal_local_metadata,
                     )
-
-            if self.internal_local_metadata[uuid].get("incompatiblewithbyversion"):
-                major, minor = self.game_version.split(".")[
-                    :2
-                ]  # Split the version and take the first two parts
-                version_regex = rf"v{major}\.{minor}"  # Construct the regex to match both major and minor versions
-                for version, incompatibilities_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["incompatiblewithbyversion"].items():
-                    if match(version_regex, version):
-                        if (
-                            incompatibilities_by_ver
-                            and isinstance(incompatibilities_by_ver, dict)
-                            and incompatibilities_by_ver.get("li")
-                        ):
-                            logger.debug(
-                                f"Current mod is incompatible by version with these mods: {incompatibilities_by_ver['li']}"
-                            )
-                            add_incompatibility_to_mod(
-                                self.internal_local_metadata[uuid],
-                                incompatibilities_by_ver["li"],
-                                self.internal_local_metadata,
-                            )
-                        else:
-                            logger.warning(
-                                f"About.xml syntax error. Unable to read <incompatiblewithbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                            )
-                            logger.debug(incompatibilities_by_ver)
-            # Current mod should be loaded AFTER these mods. These mods can be thought
-            # of as "load these before". These are not necessarily dependencies in the sense
-            # that they "depend" on them. But, if they exist in the same mod list, they
-            # should be loaded before.
-            if self.internal_local_metadata[uuid].get("loadafter"):
-                try:
-                    load_these_before = self.internal_local_metadata[uuid][
-                        "loadafter"
-                    ].get("li")
-                    if load_these_before:
-                        logger.debug(
-                            f"Current mod should load after these mods: {load_these_before}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            load_these_before,
-                            "loadTheseBefore",
-                            "loadTheseAfter",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <loadafter> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("forceloadafter"):
-                try:
-                    force_load_these_before = self.internal_local_metadata[uuid][
-                        "forceloadafter"
-                    ].get("li")
-                    if force_load_these_before:
-                        logger.debug(
-                            f"Current mod should force load after these mods: {force_load_these_before}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            force_load_these_before,
-                            "loadTheseBefore",
-                            "loadTheseAfter",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "mod_metadata_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <forceloadafter> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("loadafterbyversion"):
-                major, minor = self.game_version.split(".")[:2]
-                version_regex = rf"v{major}\.{minor}"
-                for version, load_these_before_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["loadafterbyversion"].items():
-                    if match(version_regex, version):
-                        try:
-                            if (
-                                load_these_before_by_ver
-                                and isinstance(load_these_before_by_ver, dict)
-                                and load_these_before_by_ver.get("li")
-                            ):
-                                logger.debug(
-                                    f"Current mod should load before these mods for {version}: {load_these_before_by_ver['li']}"
-                                )
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    load_these_before_by_ver["li"],
-                                    "loadTheseBefore",
-                                    "loadTheseAfter",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                            else:
-                                logger.warning(
-                                    f"About.xml syntax error. Unable to read <loadafterbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                                )
-                                logger.debug(load_these_before_by_ver)
-                        except Exception as e:
-                            mod_metadata_path = self.internal_local_metadata[uuid].get(
-                                "metadata_file_path"
-                            )
-                            logger.warning(
-                                f"Error processing <loadafterbyversion> tag for {version} from XML: {mod_metadata_path}"
-                            )
-                            logger.debug(e)
-
-            # Current mod should be loaded BEFORE these mods
-            # The current mod is a dependency for all these mods
-            if self.internal_local_metadata[uuid].get("loadbefore"):
-                try:
-                    load_these_after = self.internal_local_metadata[uuid][
-                        "loadbefore"
-                    ].get("li")
-                    if load_these_after:
-                        logger.debug(
-                            f"Current mod should load before these mods: {load_these_after}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            load_these_after,
-                            "loadTheseAfter",
-                            "loadTheseBefore",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <loadbefore> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("forceloadbefore"):
-                try:
-                    force_load_these_after = self.internal_local_metadata[uuid][
-                        "forceloadbefore"
-                    ].get("li")
-                    if force_load_these_after:
-                        logger.debug(
-                            f"Current mod should force load before these mods: {force_load_these_after}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            force_load_these_after,
-                            "loadTheseAfter",
-                            "loadTheseBefore",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
+                else:
                     logger.warning(
-                        f"About.xml syntax error. Unable to read <forceloadbefore> tag from XML: {mod_metadata_path}"
+                        f"About.xml syntax error. Unable to read <moddependenciesbyversion> tag from XML for version [{version}]: {mod_data['metadata_file_path']}"
                     )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("loadbeforebyversion"):
-                major, minor = self.game_version.split(".")[:2]
-                version_regex = rf"v{major}\.{minor}"
-                for version, load_these_after_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["loadbeforebyversion"].items():
-                    if match(version_regex, version):
-                        try:
-                            if (
-                                load_these_after_by_ver
-                                and isinstance(load_these_after_by_ver, dict)
-                                and load_these_after_by_ver.get("li")
-                            ):
-                                logger.debug(
-                                    f"Current mod should load after these mods for {version}: {load_these_after_by_ver['li']}"
-                                )
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    load_these_after_by_ver["li"],
-                                    "loadTheseAfter",
-                                    "loadTheseBefore",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                            else:
-                                logger.warning(
-                                    f"About.xml syntax error. Unable to read <loadbeforebyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                                )
-                                logger.debug(load_these_after_by_ver)
-                        except Exception as e:
-                            mod_metadata_path = self.internal_local_metadata[uuid].get(
-                                "metadata_file_path"
-                            )
-                            logger.warning(
-                                f"Error processing <loadbeforebyversion> tag for {version} from XML: {mod_metadata_path}"
-                            )
-                            logger.debug(e)
+                    logger.debug(dependencies_by_ver)
+            add_incompatibilities_from_about_xml(
+                mod_data,
+                rules_by_version,
+                installed_packageids,
+            )
+            # Current mod should be loaded AFTER <loadafter> mods and BEFORE <loadbefore>
+            # mods. These are not necessarily dependencies in the sense that they
+            # "depend" on them. But, if they exist in the same mod list, they should
+            # be ordered this way.
+            for load_rule_keys in _LOAD_RULE_KEYS:
+                add_load_rules_from_about_xml(
+                    mod_data,
+                    *load_rule_keys,
+                    rules_by_version,
+                    self.internal_local_metadata,
+                    self.packageid_to_uuids,
+                )
 
         logger.info("Finished adding dependencies through About.xml information")
         log_deps_order_info(self.internal_local_metadata)
@@ -942,10 +728,9 @@ class MetadataManager(QObject):
                 # Note: requiring the package be in self.internal_local_metadata should be fine, as
                 # if the mod doesn't exist self.internal_local_metadata, then either mod_data or dependency_id
                 # will be None, and then we don't insert a dependency
-                if package_id.lower() in self.packageid_to_uuids:
-                    potential_uuids = self.packageid_to_uuids.get(
-                        package_id.lower(), set()
-                    )
+                # Case-fold the package id once, rather than on every lookup
+                potential_uuids = self.packageid_to_uuids.get(package_id.lower())
+                if potential_uuids is not None:
                     load_these_after = self.external_community_rules[package_id].get(
                         "loadBefore"
                     )
@@ -1010,10 +795,9 @@ class MetadataManager(QObject):
                 # Note: requiring the package be in self.internal_local_metadata should be fine, as
                 # if the mod doesn't exist self.internal_local_metadata, then either mod_data or dependency_id
                 # will be None, and then we don't insert a dependency
-                if package_id.lower() in self.packageid_to_uuids:
-                    potential_uuids = self.packageid_to_uuids.get(
-                        package_id.lower(), set()
-                    )
+                # Case-fold the package id once, rather than on every lookup
+                potential_uuids = self.packageid_to_uuids.get(package_id.lower())
+                if potential_uuids is not None:
                     load_these_after = self.external_user_rules[package_id].get(
                         "loadBefore"
                     )
@@ -1084,33 +868,28 @@ class MetadataManager(QObject):
         # Initialize result to True, if an error occurs, it will be changed to False
         result = True
 
-        # Get mod data
-        mod_data = self.internal_local_metadata.get(uuid, {})
+        # Get mod data, without allocating defaults for missing keys
+        mod_data = self.internal_local_metadata.get(uuid)
+        supported_versions_tag = mod_data.get("supportedversions") if mod_data else None
 
-        # Check if game_version exists and mod_data exists and mod_data contains 'supportedversions' with 'li' key
+        # Check if game_version exists and mod_data contains 'supportedversions' with 'li' key
         if (
             self.game_version
-            and mod_data
-            and mod_data.get("supportedversions", {}).get("li")
+            and type(supported_versions_tag) is dict
+            and supported_versions_tag.get("li")
         ):
             # Get supported versions
-            supported_versions = self.internal_local_metadata[uuid][
-                "supportedversions"
-            ]["li"]
+            supported_versions = supported_versions_tag["li"]
 
             # Check if supported versions is a string or a list
-            if isinstance(supported_versions, str):
+            if type(supported_versions) is str:
                 # If game_version starts with supported_versions, result is False
                 if self.game_version.startswith(supported_versions):
                     result = False
-            elif isinstance(supported_versions, list):
+            elif type(supported_versions) is list:
                 # If any version from supported_versions starts with game_version, result is False
                 result = not any(
-                    [
-                        ver
-                        for ver in supported_versions
-                        if self.game_version.startswith(ver)
-                    ]
+                    self.game_version.startswith(ver) for ver in supported_versions
                 )
             else:
                 # If supported_versions is not a string or a list, log error and return True
@@ -1208,7 +987,7 @@ class MetadataManager(QObject):
         self.__refresh_acf_metadata()
         self.__refresh_external_metadata()
         self.__refresh_internal_metadata(is_initial=is_initial)
-        self.compile_metadata(uuids=list(self.internal_local_metadata.keys()))
+        self.compile_metadata()
 
 
 class ModParser(QRunnable):
@@ -1248,29 +1027,14 @@ class ModParser(QRunnable):
         data_malformed = None
         # Any pfid parsed will be stored here locally
         pfid = None
-        # Look for a case-insensitive "About" folder
-        invalid_about_folder_path_found = True
-        about_folder_name = "About"
-        for temp_file in os.scandir(mod_directory):
-            if (
-                temp_file.name.lower() == about_folder_name.lower()
-                and temp_file.is_dir()
-            ):
-                about_folder_name = temp_file.name
-                invalid_about_folder_path_found = False
-                break
-        # Look for a case-insensitive "About.xml" file
-        invalid_about_file_path_found = True
-        if not invalid_about_folder_path_found:
-            about_file_name = "About.xml"
-            for temp_file in os.scandir(str((directory_path / about_folder_name))):
-                if (
-                    temp_file.name.lower() == about_file_name.lower()
-                    and temp_file.is_file()
-                ):
-                    about_file_name = temp_file.name
-                    invalid_about_file_path_found = False
-                    break
+        # Look for a case-insensitive "About" folder and "About.xml" file
+        about_folder_path = find_about_folder_path(mod_directory)
+        mod_data_path = (
+            find_about_xml_path(about_folder_path)
+            if about_folder_path is not None
+            else None
+        )
+        invalid_about_file_path_found = mod_data_path is None
         # Look for .rsc scenario files to load metadata from if we didn't find About.xml
         if invalid_about_file_path_found:
             scenario_rsc_found = None
@@ -1286,17 +1050,14 @@ class ModParser(QRunnable):
         ):
             pfid = directory_name
         # Look for a case-insensitive "PublishedFileId.txt" file if we didn't find a pfid
-        elif not pfid and not invalid_about_folder_path_found:
+        elif not pfid and about_folder_path is not None:
             pfid_file_name = "PublishedFileId.txt"
-            for temp_file in os.scandir(str((directory_path / about_folder_name))):
+            for temp_file in os.scandir(about_folder_path):
                 if (
                     temp_file.name.lower() == pfid_file_name.lower()
                     and temp_file.is_file()
                 ):
-                    pfid_file_name = temp_file.name
-                    pfid_path = str(
-                        (directory_path / about_folder_name / pfid_file_name)
-                    )
+                    pfid_path = temp_file.path
                     try:
                         with open(pfid_path, encoding="utf-8-sig") as pfid_file:
                             pfid = pfid_file.read()
@@ -1305,27 +1066,23 @@ class ModParser(QRunnable):
                         logger.error(f"Failed to read pfid from {pfid_path}")
                     break
         # If we were able to find an About.xml, populate mod data...
-        if not invalid_about_file_path_found:
-            mod_data_path = str((directory_path / about_folder_name / about_file_name))
+        if mod_data_path is not None:
             logger.debug(f"Found mod metadata at: {mod_data_path}")
-            mod_data = {}
+            mod_metadata: dict[str, Any] = {}
             try:
-                # Try to parse .xml
-                mod_data = xml_path_to_json(mod_data_path)
+                # Stream only the <ModMetaData> fields we use from the .xml
+                # Keys are already normalized (lowercased, <author> -> "authors")
+                mod_metadata = mod_metadata_xml_path_to_json(mod_data_path)
             except Exception:
                 # If there was an issue parsing the .xml, track and exit
-                logger.error(
-                    f"Unable to parse {about_file_name} with the exception: {traceback.format_exc()}"
+                # Let loguru format the traceback only if a sink accepts the record
+                logger.opt(exception=True).error(
+                    "Unable to parse {} with the exception:",
+                    os.path.basename(mod_data_path),
                 )
                 data_malformed = True
             else:
-                # Case-insensitive `ModMetaData` key.
-                mod_data = {k.lower(): v for k, v in mod_data.items()}
-                if mod_data.get("modmetadata"):
-                    # Initialize our dict from the formatted About.xml metadata
-                    mod_metadata = mod_data["modmetadata"]
-                    # Case-insensitive metadata keys
-                    mod_metadata = {k.lower(): v for k, v in mod_metadata.items()}
+                if mod_metadata:
                     if (  # If we don't have a <name>
                         not mod_metadata.get("name")
                         and self.metadata_manager.external_steam_metadata  # ... try to find it in Steam DB
@@ -1344,11 +1101,6 @@ class ModParser(QRunnable):
                         mod_metadata.setdefault("DB_BUILDER_NO_NAME", True)
                     else:
                         mod_metadata.setdefault("name", "Missing XML: <name>")
-                    # Rename author tag appropriately to normalize it in usage and lookups
-                    mod_metadata = {
-                        ("authors" if key.lower() == "author" else key): value
-                        for key, value in mod_metadata.items()
-                    }
                     # Make sure <supportedversions> or <targetversion> is correct format
                     if mod_metadata.get("supportedversions") and not isinstance(
                         mod_metadata.get("supportedversions"), dict
@@ -1357,28 +1109,6 @@ class ModParser(QRunnable):
                             f"About.xml syntax error. Unable to read <supportedversions> tag from XML: {mod_data_path}"
                         )
                         mod_metadata.pop("supportedversions", None)
-                    elif mod_data.get("supportedversions", {}).get("li"):
-                        if isinstance(mod_data["supportedversions"]["li"], str):
-                            mod_data["supportedversions"]["li"] = (
-                                ".".join(
-                                    mod_data["supportedversions"]["li"].split(".")[:2]
-                                )
-                                if mod_data["supportedversions"]["li"].count(".") > 1
-                                else mod_data["supportedversions"]["li"]
-                            )
-                        elif isinstance(mod_data["supportedversions"]["li"], list):
-                            for mod_data["supportedversions"]["li"] in mod_data[
-                                "supportedversions"
-                            ]["li"]:
-                                li = mod_data["supportedversions"]["li"]
-                                if not isinstance(li, str):
-                                    logger.error(f"Failed to parse {li} as a string")
-                                    continue
-                                mod_data["supportedversions"]["li"] = (
-                                    ".".join(li.split(".")[:2])
-                                    if li.count(".") > 1 and isinstance(li, str)
-                                    else li
-                                )
                     if mod_metadata.get("targetversion"):
                         mod_metadata["targetversion"] = mod_metadata["targetversion"]
                         mod_metadata["targetversion"] = (
@@ -1522,7 +1252,7 @@ class ModParser(QRunnable):
                     metadata[uuid] = mod_metadata
                 else:
                     logger.error(
-                        f"Key <modmetadata> does not exist in this data: {mod_data}"
+                        f"No <ModMetaData> fields found in this data: {mod_data_path}"
                     )
                     data_malformed = True
         # ...or, if we didn't find an About.xml, but we have a RimWorld scenario .rsc to parse...
@@ -1535,8 +1265,8 @@ class ModParser(QRunnable):
                 scenario_data = xml_path_to_json(scenario_data_path)
             except Exception:
                 # If there was an issue parsing the .rsc, track and exit
-                logger.error(
-                    f"Unable to parse {scenario_rsc_file} with the exception: {traceback.format_exc()}"
+                logger.opt(exception=True).error(
+                    "Unable to parse {} with the exception:", scenario_rsc_file
                 )
                 data_malformed = True
             else:
@@ -1651,13 +1381,120 @@ class ModParser(QRunnable):
                 self.uuid
             )
         except Exception as e:
-            error_message = f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
-            logger.error(f"ERROR: Unable to initialize ModParser {error_message}")
+            logger.opt(exception=True).error(
+                "ERROR: Unable to initialize ModParser {}: {}", type(e).__name__, e
+            )
 
 
 # Mod helper functions
 
 
+def find_about_folder_path(mod_directory: str) -> Optional[str]:
+    """
+    Find a mod's About folder, matching its name case-insensitively.
+
+    :param mod_directory: Path to the mod directory
+    :return: Path to the About folder, or None if there is none
+    """
+    try:
+        return next(
+            (
+                entry.path
+                for entry in os.scandir(mod_directory)
+                if entry.name.lower() == "about" and entry.is_dir()
+            ),
+            None,
+        )
+    except OSError:
+        return None
+
+
+def find_about_xml_path(about_folder_path: str) -> Optional[str]:
+    """
+    Find the About.xml file in a mod's About folder, matching its name
+    case-insensitively.
+
+    :param about_folder_path: Path to the About folder, see find_about_folder_path
+    :return: Path to the About.xml file, or None if there is none
+    """
+    try:
+        return next(
+            (
+                entry.path
+                for entry in os.scandir(about_folder_path)
+                if entry.name.lower() == "about.xml" and entry.is_file()
+            ),
+            None,
+        )
+    except OSError:
+        return None
+
+
+# Shared decoder for the external databases, built once instead of per read
+_json_decoder = msgspec.json.Decoder()
+
+
+def read_json_db(path: str) -> Any:
+    """
+    Return the parsed contents of a JSON database file.
+
+    :param path: Path to the JSON file.
+    :return: The decoded JSON data, or None if the file does not exist.
+    """
+    try:
+        with open(path, "rb") as f:
+            return _json_decoder.decode(f.read())
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def get_version_pattern(game_version: str) -> re.Pattern[str]:
+    """
+    Return a compiled pattern matching <...ByVersion> keys for a game version.
+
+    The game version only takes a handful of distinct values in a session, so the
+    compiled pattern is cached instead of being rebuilt for every mod.
+
+    :param game_version: The game version string, e.g. "1.5.4104 rev435"
+    :return: Compiled pattern matching keys such as "v1.5"
+    """
+    major, minor = game_version.split(".")[:2]
+    return re.compile(rf"v{re.escape(major)}\.{re.escape(minor)}")
+
+
+# About.xml <...ByVersion> tags that RimSort compiles rules from
+_BY_VERSION_KEYS = (
+    "moddependenciesbyversion",
+    "incompatiblewithbyversion",
+    "loadafterbyversion",
+    "loadbeforebyversion",
+)
+
+
+def get_rules_by_version(
+    mod_data: dict[str, Any], version_pattern: re.Pattern[str]
+) -> dict[str, list[tuple[str, Any]]]:
+    """
+    Match all of a mod's <...ByVersion> blocks against the game version in one sweep.
+
+    :param mod_data: mod data dict to read <...ByVersion> blocks from
+    :param version_pattern: the game version pattern, see get_version_pattern
+    :return: Dict of <...ByVersion> tag to its (version, value) pairs matching the
+    game version. Tags the mod does not declare are omitted.
+    """
+    rules_by_version: dict[str, list[tuple[str, Any]]] = {}
+    for by_version_key in _BY_VERSION_KEYS:
+        blocks = mod_data.get(by_version_key)
+        if blocks:
+            rules_by_version[by_version_key] = [
+                (version, value)
+                for version, value in blocks.items()
+                if version_pattern.match(version)
+            ]
+    return rules_by_version
+
+
 def add_dependency_to_mod(
     mod_data: dict[str, Any],
     dependency_or_dependency_ids: Any,
@@ -1674,11 +1511,11 @@ def add_dependency_to_mod(
         mod_data.setdefault("dependencies", set())
 
         # If the value is a single dict (for moddependencies)
-        if isinstance(dependency_or_dependency_ids, dict):
+        if type(dependency_or_dependency_ids) is dict:
             if (
                 dependency_or_dependency_ids.get("packageId")
-                and not isinstance(dependency_or_dependency_ids["packageId"], list)
-                and not isinstance(dependency_or_dependency_ids["packageId"], dict)
+                and type(dependency_or_dependency_ids["packageId"]) is not list
+                and type(dependency_or_dependency_ids["packageId"]) is not dict
             ):
                 # if dependency_id in all_mods:
                 # ^ dependencies are required regardless of whether they are in all_mods
@@ -1690,8 +1527,8 @@ def add_dependency_to_mod(
                     f"Dependency dict does not contain packageid or correct format: [{dependency_or_dependency_ids}]"
                 )
         # If the value is a LIST of dicts
-        elif isinstance(dependency_or_dependency_ids, list):
-            if isinstance(dependency_or_dependency_ids[0], dict):
+        elif type(dependency_or_dependency_ids) is list:
+            if type(dependency_or_dependency_ids[0]) is dict:
                 for dependency in dependency_or_dependency_ids:
                     if dependency.get("packageId"):
                         # Below works with `MayRequire` dependencies
@@ -1740,35 +1577,40 @@ def get_num_dependencies(all_mods: dict[str, Any], key_name: str) -> int:
 def add_incompatibility_to_mod(
     mod_data: dict[str, Any],
     dependency_or_dependency_ids: Any,
-    all_mods: dict[str, Any],
+    installed_packageids: set[str],
 ) -> None:
     """
-    Incompatibility data is collected only if that incompatibility is in `all_mods`.
+    Incompatibility data is collected only if that incompatibility is installed.
     There's no need to surface incompatibilities if they aren't even downloaded.
+
+    :param mod_data: mod data dict to add incompatibilities to
+    :param dependency_or_dependency_ids: either string or list of strings
+    :param installed_packageids: package ids of all installed mods
     """
+    # Lazy formatting: the whole mod data dict is only formatted if DEBUG is logged
     logger.debug(
-        f"Adding incompatibilities for packages [{dependency_or_dependency_ids}] to mod data: {mod_data} (and reverse direction too)"
+        "Adding incompatibilities for packages [{}] to mod data: {} (and reverse direction too)",
+        dependency_or_dependency_ids,
+        mod_data,
     )
     if mod_data:
         # Create a new key with empty set as value by default
-        mod_data.setdefault("incompatibilities", set())
-
-        all_package_ids = set(all_mods[uuid]["packageid"] for uuid in all_mods)
+        incompatibilities = mod_data.setdefault("incompatibilities", set())
 
         # If the value is a single string...
-        if isinstance(dependency_or_dependency_ids, str):
+        if type(dependency_or_dependency_ids) is str:
             dependency_id = dependency_or_dependency_ids.lower()
-            if dependency_id in all_package_ids:
-                mod_data["incompatibilities"].add(dependency_id)
+            if dependency_id in installed_packageids:
+                incompatibilities.add(dependency_id)
 
         # If the value is a LIST of strings
-        elif isinstance(dependency_or_dependency_ids, list):
-            if isinstance(dependency_or_dependency_ids[0], str):
+        elif type(dependency_or_dependency_ids) is list:
+            if type(dependency_or_dependency_ids[0]) is str:
                 for dependency in dependency_or_dependency_ids:
                     if dependency:  # Sometimes, this can be None or an empty string if XML syntax error/extra elements
                         dependency_id = dependency.lower()
-                        if dependency_id in all_package_ids:
-                            mod_data["incompatibilities"].add(dependency_id)
+                        if dependency_id in installed_packageids:
+                            incompatibilities.add(dependency_id)
             else:
                 logger.error(
                     f"List of incompatibilities does not contain strings: [{dependency_or_dependency_ids}]"
@@ -1779,6 +1621,145 @@ def add_incompatibility_to_mod(
             )
 
 
+# About.xml load rule tags, as (tag, <...ByVersion> tag, <forceLoad...> tag,
+# explicit_key, indirect_key) for add_load_rules_from_about_xml
+_LOAD_RULE_KEYS = (
+    (
+        "loadafter",
+        "loadafterbyversion",
+        "forceloadafter",
+        "loadTheseBefore",
+        "loadTheseAfter",
+    ),
+    (
+        "loadbefore",
+        "loadbeforebyversion",
+        "forceloadbefore",
+        "loadTheseAfter",
+        "loadTheseBefore",
+    ),
+)
+
+
+def add_incompatibilities_from_about_xml(
+    mod_data: dict[str, Any],
+    rules_by_version: dict[str, list[tuple[str, Any]]],
+    installed_packageids: set[str],
+) -> None:
+    """
+    Add the incompatibilities a mod declares in <incompatibleWith> and
+    <incompatibleWithByVersion> for the current game version.
+
+    :param mod_data: mod data dict to add incompatibilities to
+    :param rules_by_version: the mod's matched <...ByVersion> blocks, see
+    get_rules_by_version
+    :param installed_packageids: package ids of all installed mods
+    """
+    incompatiblewith = mod_data.get("incompatiblewith")
+    if incompatiblewith:
+        incompatibilities = incompatiblewith.get("li")
+        if incompatibilities:
+            logger.debug(
+                f"Current mod is incompatible with these mods: {incompatibilities}"
+            )
+            add_incompatibility_to_mod(
+                mod_data, incompatibilities, installed_packageids
+            )
+
+    for version, incompatibilities_by_ver in rules_by_version.get(
+        "incompatiblewithbyversion", ()
+    ):
+        if (
+            incompatibilities_by_ver
+            and type(incompatibilities_by_ver) is dict
+            and incompatibilities_by_ver.get("li")
+        ):
+            logger.debug(
+                f"Current mod is incompatible by version with these mods: {incompatibilities_by_ver['li']}"
+            )
+            add_incompatibility_to_mod(
+                mod_data, incompatibilities_by_ver["li"], installed_packageids
+            )
+        else:
+            logger.warning(
+                f"About.xml syntax error. Unable to read <incompatiblewithbyversion> tag from XML for version [{version}]: {mod_data.get('metadata_file_path')}"
+            )
+            logger.debug(incompatibilities_by_ver)
+
+
+def add_load_rules_from_about_xml(
+    mod_data: dict[str, Any],
+    key: str,
+    by_version_key: str,
+    force_key: str,
+    explicit_key: str,
+    indirect_key: str,
+    rules_by_version: dict[str, list[tuple[str, Any]]],
+    all_mods: dict[str, Any],
+    packageid_to_uuids: dict[str, Any],
+) -> None:
+    """
+    Add the load order rules a mod declares in About.xml for one direction, i.e.
+    from <loadAfter>, <forceLoadAfter> and <loadAfterByVersion>.
+
+    :param mod_data: mod data dict to add load order rules to
+    :param key: the load rule tag, e.g. "loadafter"
+    :param by_version_key: the versioned load rule tag, e.g. "loadafterbyversion"
+    :param force_key: the forced load rule tag, e.g. "forceloadafter"
+    :param explicit_key: see add_load_rule_to_mod
+    :param indirect_key: see add_load_rule_to_mod
+    :param rules_by_version: the mod's matched <...ByVersion> blocks, see
+    get_rules_by_version
+    :param all_mods: dict of all mods to verify keys against
+    :param packageid_to_uuids: a helper dict to reduce work
+    """
+    for rule_key in (key, force_key):
+        rules_tag = mod_data.get(rule_key)
+        if rules_tag:
+            try:
+                rules = rules_tag.get("li")
+                if rules:
+                    logger.debug(f"Current mod has <{rule_key}> rules: {rules}")
+                    add_load_rule_to_mod(
+                        mod_data,
+                        rules,
+                        explicit_key,
+                        indirect_key,
+                        all_mods,
+                        packageid_to_uuids,
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"About.xml syntax error. Unable to read <{rule_key}> tag from XML: {mod_data.get('metadata_file_path')}"
+                )
+                logger.debug(e)
+
+    for version, rules_by_ver in rules_by_version.get(by_version_key, ()):
+        try:
+            if rules_by_ver and type(rules_by_ver) is dict and rules_by_ver.get("li"):
+                logger.debug(
+                    f"Current mod has <{by_version_key}> rules for {version}: {rules_by_ver['li']}"
+                )
+                add_load_rule_to_mod(
+                    mod_data,
+                    rules_by_ver["li"],
+                    explicit_key,
+                    indirect_key,
+                    all_mods,
+                    packageid_to_uuids,
+                )
+            else:
+                logger.warning(
+                    f"About.xml syntax error. Unable to read <{by_version_key}> tag from XML for version [{version}]: {mod_data.get('metadata_file_path')}"
+                )
+                logger.debug(rules_by_ver)
+        except Exception as e:
+            logger.warning(
+                f"Error processing <{by_version_key}> tag for {version} from XML: {mod_data.get('metadata_file_path')}"
+            )
+            logger.debug(e)
+
+
 def add_load_rule_to_mod(
     mod_data: dict[str, Any],
     dependency_or_dependency_ids: Any,
@@ -1805,40 +1786,37 @@ def add_load_rule_to_mod(
     if not mod_data:
         return
 
-    # Pre-processing: Normalize dependency_or_dependency_ids to a list of strings
-    dependencies = []
-    if isinstance(dependency_or_dependency_ids, str):
-        dependencies.append(dependency_or_dependency_ids.lower())
-    elif isinstance(dependency_or_dependency_ids, dict):
-        if "#text" in dependency_or_dependency_ids:
-            dependencies.append(dependency_or_dependency_ids["#text"].lower())
-        else:
-            logger.error(
-                f"Load rule with MayRequire does not contain expected #text key: {dependency_or_dependency_ids}"
-            )
-    elif isinstance(dependency_or_dependency_ids, list):
-        for dep in dependency_or_dependency_ids:
-            if isinstance(dep, str):
-                dependencies.append(dep.lower())
-            elif isinstance(dep, dict) and "#text" in dep:
-                dependencies.append(dep["#text"].lower())
-            else:
-                logger.error(f"Load rule is not an expected str or dict: {dep}")
+    # Parsed XML only contains exact str/dict/list types, so dispatch on type()
+    # and handle single values and lists with the same loop
+    value_type = type(dependency_or_dependency_ids)
+    if value_type is list:
+        values = dependency_or_dependency_ids
+    elif value_type is str or value_type is dict:
+        values = (dependency_or_dependency_ids,)
     else:
         logger.error(
             f"Load order rules is not a single string/dict/list of strings/dicts: [{dependency_or_dependency_ids}]"
         )
         return
 
-    mod_data.setdefault(explicit_key, set())
-    for dep in dependencies:
-        if dep in packageid_to_uuids:
-            mod_data[explicit_key].add((dep, True))
-            potential_dep_uuids = packageid_to_uuids[dep]
+    # Normalize and add each rule in a single pass, without an intermediate list
+    explicit_rules = mod_data.setdefault(explicit_key, set())
+    indirect_rule = (mod_data["packageid"], False)
+    for dep in values:
+        dep_type = type(dep)
+        if dep_type is str:
+            dep_id = dep.lower()
+        elif dep_type is dict and "#text" in dep:
+            # Load rule with MayRequire/IfModActive attributes
+            dep_id = dep["#text"].lower()
+        else:
+            logger.error(f"Load rule is not an expected str or dict: {dep}")
+            continue
+        potential_dep_uuids = packageid_to_uuids.get(dep_id)
+        if potential_dep_uuids is not None:
+            explicit_rules.add((dep_id, True))
             for dep_uuid in potential_dep_uuids:
-                all_mods[dep_uuid].setdefault(indirect_key, set()).add(
-                    (mod_data["packageid"], False)
-                )
+                all_mods[dep_uuid].setdefault(indirect_key, set()).add(indirect_rule)
 
 
 def get_mods_from_list(
@@ -1861,10 +1839,10 @@ def get_mods_from_list(
     active_mods_uuids: list[str] = []
     inactive_mods_uuids: list[str] = []
     duplicate_mods: dict[str, Any] = {}
-    duplicates_processed = []
+    duplicates_processed: set[str] = set()
     missing_mods: list[str] = []
-    populated_mods = []
-    to_populate = []
+    populated_mods: set[str] = set()
+    to_populate: list[str] = []
     logger.debug("Started generating active and inactive mods")
     # Calculate duplicate mods (SCHEMA: {str packageid: list[str duplicate uuids]})
     for mod_uuid, mod_data in all_mods.items():
@@ -1899,11 +1877,12 @@ def get_mods_from_list(
     ) in package_ids_to_import:  # Go through active mods, handle packageids
         package_id_normalized = package_id.lower()
         package_id_steam_suffix = "_steam"
-        package_id_normalized_stripped = package_id_normalized.replace(
-            package_id_steam_suffix, ""
+        # _steam is only ever a suffix, so a bounded suffix check is enough
+        package_id_normalized_stripped = package_id_normalized.removesuffix(
+            package_id_steam_suffix
         )
         # bool to determine whether or not _steam suffix present in ModsConfig entry
-        is_steam = package_id_steam_suffix in package_id_normalized
+        is_steam = package_id_normalized.endswith(package_id_steam_suffix)
         # Determine target_id based on whether suffix exists
         target_id = (
             package_id_normalized_stripped
@@ -1922,16 +1901,15 @@ def get_mods_from_list(
         # Loop through all mods
         for uuid, metadata in all_mods.items():
             metadata_package_id = metadata["packageid"]
+            # If we have a match with or without _steam present. Compare directly
+            # rather than building a temporary list for every mod
             if (
-                metadata_package_id
-                in [  # If we have a match with or without _steam present
-                    package_id_normalized,
-                    package_id_normalized_stripped,
-                ]
+                metadata_package_id == package_id_normalized
+                or metadata_package_id == package_id_normalized_stripped
             ):
                 # Add non-duplicates to active mods
-                if target_id not in duplicate_mods.keys():
-                    populated_mods.append(target_id)
+                if target_id not in duplicate_mods:
+                    populated_mods.add(target_id)
                     active_mods_uuids.append(uuid)
                 else:  # Otherwise, duplicate needs calculated
                     if (
@@ -1961,20 +1939,21 @@ def get_mods_from_list(
                             logger.debug(
                                 f"Using duplicate {source} mod for {target_id}: {all_mods[calculated_duplicate_uuid]['path']}"
                             )
-                            populated_mods.append(target_id)
-                            duplicates_processed.append(target_id)
+                            populated_mods.add(target_id)
+                            duplicates_processed.add(target_id)
                             active_mods_uuids.append(calculated_duplicate_uuid)
                             break
                         else:  # Skip this source priority if no paths
                             logger.debug(f"No paths returned for {source}")
                             continue
     # Calculate missing mods from the difference
-    missing_mods = list(set(to_populate) - set(populated_mods))
+    missing_mods = list(set(to_populate) - populated_mods)
     logger.debug(f"Generated active mods dict with {len(active_mods_uuids)} mods")
     # Get the inactive mods by subtracting active mods from workshop + expansions
     logger.info("Generating inactive mod list")
+    active_mods_uuids_set = set(active_mods_uuids)
     inactive_mods_uuids = [
-        uuid for uuid in all_mods.keys() if uuid not in active_mods_uuids
+        uuid for uuid in all_mods if uuid not in active_mods_uuids_set
     ]
     logger.info(f"# active mods: {len(active_mods_uuids)}")
     logger.info(f"# inactive mods: {len(inactive_mods_uuids)}")
@@ -1,9 +1,35 @@
 import os
-from typing import Any
+from typing import Any, Iterator
 
 import xmltodict
 from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import etree
+
+# Lowercase <ModMetaData> child tags that RimSort reads from About.xml, mapped to
+# the key they are stored under in RimSort's mod metadata
+MOD_METADATA_FIELDS: dict[str, str] = {
+    "packageid": "packageid",
+    "name": "name",
+    "description": "description",
+    "author": "authors",
+    "authors": "authors",
+    "supportedversions": "supportedversions",
+    "targetversion": "targetversion",
+    "moddependencies": "moddependencies",
+    "moddependenciesbyversion": "moddependenciesbyversion",
+    "loadbefore": "loadbefore",
+    "loadbeforebyversion": "loadbeforebyversion",
+    "forceloadbefore": "forceloadbefore",
+    "loadafter": "loadafter",
+    "loadafterbyversion": "loadafterbyversion",
+    "forceloadafter": "forceloadafter",
+    "incompatiblewith": "incompatiblewith",
+    "incompatiblewithbyversion": "incompatiblewithbyversion",
+    "modversion": "modversion",
+    "url": "url",
+    "modiconpath": "modiconpath",
+}
 
 
 def xml_path_to_json(path: str) -> dict[str, Any]:
@@ -45,6 +71,90 @@ def xml_path_to_json(path: str) -> dict[str, Any]:
         return data
 
 
+def _element_to_json(element: Any) -> Any:
+    """
+    Convert an lxml element to the same structure xmltodict would produce for it.
+
+    :param element: The lxml element to convert.
+    :return: None, a str, or a dict of attributes, "#text" and child values.
+    """
+    data: dict[str, Any] = {f"@{key}": value for key, value in element.attrib.items()}
+    text_parts = [element.text] if element.text else []
+    for child in element:
+        if child.tail:
+            text_parts.append(child.tail)
+        # Skip comments and processing instructions
+        if not isinstance(child.tag, str):
+            continue
+        value = _element_to_json(child)
+        if child.tag not in data:
+            data[child.tag] = value
+        elif isinstance(data[child.tag], list):
+            data[child.tag].append(value)
+        else:
+            data[child.tag] = [data[child.tag], value]
+    text = "".join(text_parts).strip() or None
+    if not data:
+        return text
+    if text is not None:
+        data["#text"] = text
+    return data
+
+
+def iter_modmetadata_fields(path: str) -> Iterator[tuple[str, Any]]:
+    """
+    Stream the <ModMetaData> fields RimSort uses from an About.xml file.
+
+    Only the children listed in MOD_METADATA_FIELDS are converted, using the same
+    structure as xml_path_to_json. Every other element is discarded as soon as it
+    has been parsed, so no intermediate tree is kept for the whole document.
+
+    :param path: Path to the About.xml file.
+    :return: Iterator of (tag, value) pairs in document order.
+    :raises ValueError: If the root element is not <ModMetaData>.
+    """
+    depth = 0
+    for event, element in etree.iterparse(
+        path, events=("start", "end"), recover=True, remove_comments=True
+    ):
+        if event == "start":
+            depth += 1
+            if depth == 1 and str(element.tag).lower() != "modmetadata":
+                raise ValueError(f"Root element is not <ModMetaData>: {element.tag}")
+            continue
+        if depth == 2:
+            if str(element.tag).lower() in MOD_METADATA_FIELDS:
+                yield element.tag, _element_to_json(element)
+            # Free the finished field and any siblings already handled
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        depth -= 1
+
+
+def mod_metadata_xml_path_to_json(path: str) -> dict[str, Any]:
+    """
+    Return the <ModMetaData> fields RimSort uses from an About.xml file.
+
+    Fields are stored directly under their MOD_METADATA_FIELDS key, so no further
+    key normalization is needed. Only a repeated literal tag is collected into a
+    list, as xmltodict does. Different tags that map to the same key, such as
+    <author> and <authors>, do not merge: the one appearing last wins.
+
+    :param path: Path to the About.xml file.
+    :return: Dict of RimSort metadata keys to their values.
+    """
+    fields: dict[str, Any] = {}
+    for tag, value in iter_modmetadata_fields(path):
+        if tag not in fields:
+            fields[tag] = value
+        elif isinstance(fields[tag], list):
+            fields[tag].append(value)
+        else:
+            fields[tag] = [fields[tag], value]
+    return {MOD_METADATA_FIELDS[tag.lower()]: value for tag, value in fields.items()}
+
+
 def json_to_xml_write(data: dict[str, Any], path: str) -> None:
     """
     Write JSON data to an XML file.
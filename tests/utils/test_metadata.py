@@ -0,0 +1,123 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from app.utils.metadata import (
+    _LOAD_RULE_KEYS,
+    add_incompatibilities_from_about_xml,
+    add_load_rules_from_about_xml,
+    get_rules_by_version,
+    get_version_pattern,
+    read_json_db,
+)
+
+GAME_VERSION = "1.5.4104 rev435"
+
+
+def compile_about_xml_rules(all_mods: dict[str, Any]) -> None:
+    packageid_to_uuids: dict[str, set[str]] = {}
+    for uuid, mod_data in all_mods.items():
+        packageid_to_uuids.setdefault(mod_data["packageid"], set()).add(uuid)
+    installed_packageids = set(packageid_to_uuids)
+    version_pattern = get_version_pattern(GAME_VERSION)
+    for mod_data in all_mods.values():
+        rules_by_version = get_rules_by_version(mod_data, version_pattern)
+        add_incompatibilities_from_about_xml(
+            mod_data, rules_by_version, installed_packageids
+        )
+        for load_rule_keys in _LOAD_RULE_KEYS:
+            add_load_rules_from_about_xml(
+                mod_data,
+                *load_rule_keys,
+                rules_by_version,
+                all_mods,
+                packageid_to_uuids,
+            )
+
+
+def test_read_json_db(tmp_path: Path) -> None:
+    path = tmp_path / "communityRules.json"
+    path.write_text(json.dumps({"timestamp": 1, "rules": {}}), encoding="utf-8")
+
+    assert read_json_db(str(path)) == {"timestamp": 1, "rules": {}}
+
+
+def test_read_json_db_returns_fresh_data(tmp_path: Path) -> None:
+    path = tmp_path / "communityRules.json"
+    path.write_text(
+        json.dumps({"rules": {"a.b": {"loadAfter": {"c.d": {}}}}}), encoding="utf-8"
+    )
+
+    data = read_json_db(str(path))
+    data["rules"]["a.b"]["loadAfter"].pop("c.d")
+    assert read_json_db(str(path)) == {"rules": {"a.b": {"loadAfter": {"c.d": {}}}}}
+
+
+def test_read_json_db_missing_file(tmp_path: Path) -> None:
+    assert read_json_db(str(tmp_path / "missing.json")) is None
+
+
+def test_load_after_rules() -> None:
+    all_mods: dict[str, Any] = {
+        "a": {
+            "packageid": "a.a",
+            "loadafter": {
+                "li": ["B.b", {"@IfModActive": "c.c", "#text": "C.c"}, "missing.mod"]
+            },
+        },
+        "b": {"packageid": "b.b"},
+        "c": {"packageid": "c.c"},
+    }
+    compile_about_xml_rules(all_mods)
+
+    # a loads after b and c, so b and c load before a
+    assert all_mods["a"]["loadTheseBefore"] == {("b.b", True), ("c.c", True)}
+    assert "loadTheseAfter" not in all_mods["a"]
+    assert all_mods["b"]["loadTheseAfter"] == {("a.a", False)}
+    assert all_mods["c"]["loadTheseAfter"] == {("a.a", False)}
+
+
+def test_force_load_before_rules() -> None:
+    all_mods: dict[str, Any] = {
+        "a": {"packageid": "a.a", "forceloadbefore": {"li": "b.b"}},
+        "b": {"packageid": "b.b"},
+    }
+    compile_about_xml_rules(all_mods)
+
+    # a loads before b, so b loads after a
+    assert all_mods["a"]["loadTheseAfter"] == {("b.b", True)}
+    assert all_mods["b"]["loadTheseBefore"] == {("a.a", False)}
+
+
+def test_rules_by_version_match_game_version() -> None:
+    all_mods: dict[str, Any] = {
+        "a": {
+            "packageid": "a.a",
+            "loadbeforebyversion": {"v1.5": {"li": "b.b"}, "v1.4": {"li": "c.c"}},
+            "incompatiblewithbyversion": {
+                "v1.4": {"li": "b.b"},
+                "v1.5": {"li": ["c.c", "missing.mod"]},
+            },
+        },
+        "b": {"packageid": "b.b"},
+        "c": {"packageid": "c.c"},
+    }
+    compile_about_xml_rules(all_mods)
+
+    assert all_mods["a"]["loadTheseAfter"] == {("b.b", True)}
+    assert all_mods["b"]["loadTheseBefore"] == {("a.a", False)}
+    assert "loadTheseBefore" not in all_mods["c"]
+    assert all_mods["a"]["incompatibilities"] == {"c.c"}
+
+
+def test_malformed_load_rule_tag_is_skipped() -> None:
+    all_mods: dict[str, Any] = {
+        "a": {"packageid": "a.a", "loadafter": "b.b", "loadbefore": {"li": "b.b"}},
+        "b": {"packageid": "b.b"},
+    }
+    compile_about_xml_rules(all_mods)
+
+    # A str-valued <loadAfter> cannot be read and is skipped, <loadBefore> still is
+    assert all_mods["a"].get("loadTheseBefore", set()) == set()
+    assert all_mods["a"]["loadTheseAfter"] == {("b.b", True)}
+    assert all_mods["b"]["loadTheseBefore"] == {("a.a", False)}
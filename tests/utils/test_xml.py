@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from app.utils.xml import (
+    MOD_METADATA_FIELDS,
+    mod_metadata_xml_path_to_json,
+    xml_path_to_json,
+)
+
+ABOUT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<ModMetaData>
+  <!-- Comments are ignored -->
+  <name>Test Mod</name>
+  <Author>Someone</Author>
+  <packageId>Someone.TestMod</packageId>
+  <supportedVersions><li>1.4</li><li>1.5</li></supportedVersions>
+  <modDependencies>
+    <li><packageId>brrainz.harmony</packageId><displayName>Harmony</displayName></li>
+  </modDependencies>
+  <loadAfter><li>a.b</li><li IfModActive="x.y">c.d</li></loadAfter>
+  <loadAfterByVersion><v1.5><li>e.f</li></v1.5></loadAfterByVersion>
+  <descriptionsByVersion><v1.5>Unused</v1.5></descriptionsByVersion>
+  <url></url>
+</ModMetaData>
+"""
+
+
+def test_mod_metadata_xml_path_to_json_matches_xmltodict(tmp_path: Path) -> None:
+    path = tmp_path / "About.xml"
+    path.write_text(ABOUT_XML, encoding="utf-8")
+
+    expected = {
+        MOD_METADATA_FIELDS[key.lower()]: value
+        for key, value in xml_path_to_json(str(path))["ModMetaData"].items()
+        if key.lower() in MOD_METADATA_FIELDS
+    }
+    assert mod_metadata_xml_path_to_json(str(path)) == expected
+
+
+def test_mod_metadata_xml_path_to_json_skips_unused_fields(tmp_path: Path) -> None:
+    path = tmp_path / "About.xml"
+    path.write_text(ABOUT_XML, encoding="utf-8")
+
+    data = mod_metadata_xml_path_to_json(str(path))
+    assert "descriptionsbyversion" not in data
+    assert data["authors"] == "Someone"
+    assert data["loadafter"] == {"li": ["a.b", {"@IfModActive": "x.y", "#text": "c.d"}]}
+
+
+def test_mod_metadata_xml_path_to_json_overwrites_colliding_tags(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "About.xml"
+    path.write_text(
+        """<ModMetaData>
+  <author>X</author>
+  <packageId>a.b</packageId>
+  <authors><li>Y</li><li>Z</li></authors>
+  <PackageId>c.d</PackageId>
+</ModMetaData>
+""",
+        encoding="utf-8",
+    )
+
+    data = mod_metadata_xml_path_to_json(str(path))
+    assert data["authors"] == {"li": ["Y", "Z"]}
+    assert data["packageid"] == "c.d"